@@ -1,7 +1,94 @@
+import struct
+import zlib
+
 # Frame type identifiers
 DATA = 0
 ACK = 1
 
+# Precompiled packer for the fixed part of the frame:
+# [ Header (1 byte) | Length (1 byte) ]
+# A module-level struct.Struct avoids re-parsing the format string and
+# is noticeably faster than per-field int.to_bytes calls.
+_HDR = struct.Struct(">BB")
+
+# Precomputed reverse header table: header byte -> (frame_type, seq, ack).
+# The header space is only 256 values, so decoding becomes one indexed
+# tuple unpack instead of three shift/mask operations per frame. The
+# forward direction needs no table: with 3-bit fields the packed header
+# is numerically identical to its own table index.
+_HEADER_FIELDS = tuple(
+    ((b >> 6) & 0b11, (b >> 3) & 0b111, b & 0b111) for b in range(256)
+)
+
+
+# ---------------------------------------------------------------------------
+# Codec kernels
+#
+# The hot serialize / checksum / deserialize loops live here as free
+# functions over plain buffers, with the Frame class as a thin wrapper.
+# Keeping them free of class state avoids method-dispatch overhead per
+# frame and leaves them in a shape a JIT compiler could take as-is.
+# ---------------------------------------------------------------------------
+
+def _checksum(data) -> int:
+    """
+    Compute the 1-byte frame checksum: CRC-32 truncated to its low byte.
+
+    zlib.crc32 runs in C at memcpy-like speed, so this is both faster
+    than a Python-side byte sum and a stronger error detector (a plain
+    sum misses reordered bytes and compensating bit flips).
+    """
+    return zlib.crc32(data) & 0xFF
+
+
+def _encode(frame_type, seq, ack, payload: bytes) -> bytes:
+    """Serialize the given fields into complete frame bytes."""
+    n = len(payload)
+    buf = bytearray(n + 3)
+    buf[0] = ack + (seq << 3) + (frame_type << 6)
+    buf[1] = n
+    buf[2:2 + n] = payload
+    # memoryview avoids copying the checksummed prefix out of buf
+    buf[n + 2] = _checksum(memoryview(buf)[:n + 2])
+    return bytes(buf)
+
+
+def _decode(raw):
+    """
+    Parse raw frame bytes into (frame_type, seq, ack, payload, length).
+
+    Raises ValueError on truncated frames, length mismatches and
+    checksum failures.
+    """
+
+    # Minimum frame size: header + length + checksum
+    if len(raw) < 3:
+        raise ValueError("Frame too short")
+
+    # Extract fixed fields
+    header, length = _HDR.unpack_from(raw, 0)
+
+    # Validate frame length against the length field
+    if len(raw) != 1 + 1 + length + 1:
+        raise ValueError("Invalid frame length")
+
+    # Slice through a memoryview so the checksum verification reads the
+    # original buffer in place instead of copying the frame prefix
+    mv = memoryview(raw)
+
+    # Verify checksum over everything but the trailer byte
+    if _checksum(mv[:-1]) != raw[-1]:
+        raise ValueError("Checksum mismatch")
+
+    # Decode header fields via the precomputed reverse table
+    frame_type, seq, ack = _HEADER_FIELDS[header]
+
+    # Only the payload is materialized as bytes (the single copy that
+    # callers actually keep); this also normalizes mutable buffers such
+    # as a bytearray from the channel's corruptor
+    return frame_type, seq, ack, bytes(mv[2:2 + length]), length
+
+
 class Frame:
     """
     Represents a data link layer frame used by the Go-Back-N protocol.
@@ -12,6 +99,11 @@ class Frame:
     - a simple checksum for error detection
     """
 
+    # Fixed attribute layout: drops the per-instance __dict__, shrinking
+    # every frame (relevant while unacknowledged frames sit in the
+    # sender's buffer) and making attribute access a C-level slot read.
+    __slots__ = ("frame_type", "seq", "ack", "payload", "length", "checksum")
+
     def __init__(self, frame_type, seq, ack, payload: bytes):
         """
         Create a new frame.
@@ -51,7 +143,28 @@ class Frame:
         
         # Checksum is computed during serialization
         self.checksum = None
-    
+
+    @classmethod
+    def _new(cls, frame_type, seq, ack, payload: bytes, length=None):
+        """
+        Create a frame without input validation.
+
+        Internal fast-path constructor for trusted callers whose fields
+        are already known to be valid: deserialization (the checksum and
+        length checks in from_bytes have passed) and the protocol
+        endpoints building frames from their own state. The public
+        __init__ keeps the full validation for external use.
+        """
+
+        frame = object.__new__(cls)
+        frame.frame_type = frame_type
+        frame.seq = seq
+        frame.ack = ack
+        frame.payload = payload
+        frame.length = len(payload) if length is None else length
+        frame.checksum = None
+        return frame
+
     def build_header(self):
         """
         Build the 1-byte frame header.
@@ -62,11 +175,10 @@ class Frame:
         - bits 2–0: acknowledgment number
         """
         
-        header = 0
-        header |= (self.frame_type & 0b11) << 6
-        header |= (self.seq & 0b111) << 3
-        header |= (self.ack & 0b111)
-        return header
+        # Fields are already validated in __init__, so the bits cannot
+        # overlap and plain addition composes them (slightly cheaper
+        # than masking and or-ing each field).
+        return self.ack + (self.seq << 3) + (self.frame_type << 6)
     
     def to_bytes_without_checksum(self) -> bytes:
         """
@@ -76,20 +188,17 @@ class Frame:
         [ Header (1 byte) | Length (1 byte) | Payload (N bytes) ]
         """
 
-        header = self.build_header().to_bytes(1, "big")
-        length = self.length.to_bytes(1, "big")
-        payload = self.payload
-        return header + length + payload
+        return _HDR.pack(self.build_header(), self.length) + self.payload
     
     @staticmethod
     def calculate_checksum(data: bytes) -> int:
         """
-        Compute a simple checksum over the given data.
+        Compute the checksum over the given data.
 
-        The checksum is the sum of all bytes modulo 256.
+        The checksum is the CRC-32 of the data truncated to one byte.
         """
 
-        return sum(data) % 256
+        return _checksum(data)
     
     def to_bytes_all(self) -> bytes:
         """
@@ -97,11 +206,13 @@ class Frame:
 
         Layout:
         [ Header | Length | Payload | Checksum ]
+
+        The frame is written into a single preallocated buffer instead
+        of concatenating header, length, payload and checksum, which
+        would allocate (and copy) an intermediate bytes object per join.
         """
 
-        data = self.to_bytes_without_checksum()
-        checksum = Frame.calculate_checksum(data).to_bytes(1, "big")
-        return data + checksum
+        return _encode(self.frame_type, self.seq, self.ack, self.payload)
     
     @staticmethod
     def from_bytes(raw: bytes):
@@ -114,39 +225,20 @@ class Frame:
         - checksum verification
         - header field extraction
         """
-        
-        # Minimum frame size: header + length + checksum
-        if len(raw) < 3:
-            raise ValueError("Frame too short")
-        
-        # Extract fixed fields
-        header = raw[0]
-        length = raw[1]
-        
-        # Expected total size based on length field
-        expected_size = 1 + 1 + length + 1
-        
-        # Validate frame length
-        if len(raw) != expected_size:
-            raise ValueError("Invalid frame length")
-        
-        # Extract payload and checksum
-        payload = raw[2:2 + length]
-        received_checksum = raw[-1]
-        
-        # Recalculate checksum
-        data_without_checksum = raw[:-1]
-        calculated = Frame.calculate_checksum(data_without_checksum)
-        
-        if calculated != received_checksum:
-            raise ValueError("Checksum mismatch")
-        
-        # Decode header fields
-        frame_type = (header >> 6) & 0b11
-        seq = (header >> 3) & 0b111
-        ack = header & 0b111
-        
-        return Frame(frame_type, seq, ack, payload)
+
+        frame_type, seq, ack, payload, length = _decode(raw)
+
+        # The checksum and length checks in _decode already vouch for
+        # the fields, so skip the public constructor's validation
+        return Frame._new(frame_type, seq, ack, payload, length)
+
+
+# Precomputed wire images of every possible standalone ACK frame.
+# A standalone ACK always has seq=0 and an empty payload, so there are
+# only 8 distinct frames (one per ACK number). Serializing them once at
+# import time lets the receiver send an ACK with a single tuple lookup
+# instead of building and validating an identical frame every time.
+ACK_FRAMES = tuple(Frame(ACK, 0, ack, b"").to_bytes_all() for ack in range(8))
 
 
 
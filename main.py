@@ -35,9 +35,17 @@ sender.send_data(b"msg-7")
 sender.send_data(b"msg-8")
 sender.send_data(b"msg-9")
 
-# Main simulation loop
-# Periodically checks for sender timeouts
-# Retransmissions are triggered if ACKs are not received in time
+# Main simulation loop (event-driven)
+# Instead of polling every 100 ms, sleep exactly until the sender's
+# retransmission deadline and wake once per timeout event.
+# Retransmissions are triggered if ACKs are not received in time.
 while True:
+    remaining = sender.time_until_timeout()
+    if remaining is None:
+        # No outstanding frames: everything has been acknowledged
+        break
+    if remaining > 0:
+        time.sleep(remaining)
     sender.check_timeout()
-    time.sleep(0.1)
+
+print("Simulation finished: all frames acknowledged")
@@ -20,11 +20,30 @@ class Channel:
         """
         self.loss_prob = loss_prob
         self.corrupt_prob = corrupt_prob
-        
+
+        # Precomputed guards so a reliable channel (probability 0) skips
+        # the RNG draws entirely instead of rolling a die it can't lose
+        self._check_loss = loss_prob > 0.0
+        self._check_corrupt = corrupt_prob > 0.0
+
+        # Cache the RNG entry points as bound callables: send() draws
+        # random numbers for every frame, and going through the module
+        # global plus an attribute lookup each time adds measurable
+        # per-frame overhead. These share the module's generator, so
+        # random.seed() still controls reproducibility.
+        self._random = random.random
+        self._randrange = random.randrange
+
         # References to protocol endpoints (set later via connect)
         self.sender = None
         self.receiver = None
-    
+
+        # Bound delivery callbacks, cached at connect time so sending
+        # dispatches by function reference instead of comparing a
+        # direction string per frame
+        self._deliver_to_receiver = None
+        self._deliver_to_sender = None
+
     def connect(self, sender, receiver):
         """
         Connect the channel to a Sender and a Receiver.
@@ -33,10 +52,50 @@ class Channel:
         """
         self.sender = sender
         self.receiver = receiver
+        self._deliver_to_receiver = receiver.receive
+        self._deliver_to_sender = sender.receive_ack
+
+    def send_to_receiver(self, data: bytes):
+        """
+        Transmit a frame from the sender towards the receiver.
+        """
+        self._deliver(data, self._deliver_to_receiver)
+
+    def send_many_to_receiver(self, raws):
+        """
+        Transmit a batch of frames towards the receiver.
+
+        Used by the sender's Go-Back-N retransmission, which resends
+        every outstanding frame at once. The probability, RNG and
+        delivery lookups are hoisted out of the loop, so each frame in
+        the batch pays only for its own random draws.
+        """
+
+        rand = self._random
+        loss_prob = self.loss_prob
+        corrupt_prob = self.corrupt_prob
+        check_loss = self._check_loss
+        check_corrupt = self._check_corrupt
+        deliver = self._deliver_to_receiver
 
-    def send(self, data: bytes, direction="sender_to_receiver"):
+        for raw in raws:
+            if check_loss and rand() < loss_prob:
+                print("Channel: frame lost")
+                continue
+            if check_corrupt and rand() < corrupt_prob:
+                raw = self.corrupt(raw)
+                print("Channel: frame corrupted")
+            deliver(raw)
+
+    def send_to_sender(self, data: bytes):
+        """
+        Transmit a frame (ACK or piggybacked data) back to the sender.
+        """
+        self._deliver(data, self._deliver_to_sender)
+
+    def _deliver(self, data: bytes, deliver):
         """
-        Transmit a frame through the channel.
+        Transmit a frame through the channel to the given endpoint.
 
         The frame may be:
         - lost
@@ -44,48 +103,42 @@ class Channel:
         - delivered correctly
 
         :param data: Raw frame bytes
-        :param direction: Transmission direction
-                          ("sender_to_receiver" or "receiver_to_sender")
+        :param deliver: Bound receive callback of the destination endpoint
         """
-        
+
         # Simulate random frame loss
-        if random.random() < self.loss_prob:
+        if self._check_loss and self._random() < self.loss_prob:
             print("Channel: frame lost")
             return
-        
+
         raw = data
-        
+
         # Simulate random frame corruption
-        if random.random() < self.corrupt_prob:
+        if self._check_corrupt and self._random() < self.corrupt_prob:
             raw = self.corrupt(raw)
             print("Channel: frame corrupted")
-        
-        # Deliver the frame to the appropriate endpoint
-        if direction == "sender_to_receiver":
-            # Data or ACK going to the receiver
-            self.receiver.receive(raw)
-        else:
-            # ACK or piggybacked data going back to the sender
-            self.sender.receive_ack(raw)
-
-    def corrupt(self, raw: bytes) -> bytes:
+
+        deliver(raw)
+
+    def corrupt(self, raw: bytes):
         """
         Corrupt a frame by flipping a random byte.
 
         This simulates bit errors on the link.
+
+        Returns a bytearray: the frame decoder accepts any bytes-like
+        buffer, so converting back to immutable bytes would just add an
+        allocation and a copy per corruption event.
         """
-        
+
         # Empty frames cannot be corrupted
         if len(raw) == 0:
             return raw
-        
+
         # Convert to mutable bytearray
         b = bytearray(raw)
-        
-        # Choose a random byte to corrupt
-        index = random.randint(0, len(b) - 1)
-        
-        # Flip all bits in the selected byte
-        b[index] ^= 0xFF
-        
-        return bytes(b)
+
+        # Flip all bits in a randomly chosen byte
+        b[self._randrange(len(b))] ^= 0xFF
+
+        return b
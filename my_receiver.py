@@ -1,4 +1,6 @@
-from frame import Frame
+from collections import deque
+
+from frame import Frame, ACK_FRAMES
 class Receiver:
     """
     Implements the receiver side of a reliable data link layer protocol
@@ -29,8 +31,9 @@ class Receiver:
         self.ack_pending = None
         
         # Queue simulating data coming from the network layer
-        # Used to support piggybacking
-        self.network_queue = []
+        # Used to support piggybacking; a deque gives O(1) pops from
+        # the front, where list.pop(0) would shift every element
+        self.network_queue = deque()
     
     def network_send(self, payload: bytes):
         """
@@ -53,15 +56,13 @@ class Receiver:
             return
 
         ack_num = self.ack_pending
-        
-        # Create an ACK-only frame
-        ack_frame = Frame(frame_type=1, seq=0, ack=ack_num, payload=b"")
-        
-        
-        raw = ack_frame.to_bytes_all()
-        
+
+        # Look up the prebuilt ACK-only frame (all 8 are serialized once
+        # at import time in frame.py)
+        raw = ACK_FRAMES[ack_num]
+
         # Send ACK frame to sender
-        self.channel.send(raw, direction="receiver_to_sender")
+        self.channel.send_to_sender(raw)
         
         print(f"Receiver: sent standalone ACK={self.ack_pending}")
         
@@ -78,13 +79,14 @@ class Receiver:
 
         ack = self.ack_pending if self.ack_pending is not None else 0
         
-        # Create DATA frame with piggybacked ACK
-        frame = Frame(frame_type=0, seq=0, ack=ack, payload=payload)
+        # Create DATA frame with piggybacked ACK (fields come from
+        # internal state, so the unchecked constructor is safe here)
+        frame = Frame._new(frame_type=0, seq=0, ack=ack, payload=payload)
         
         raw = frame.to_bytes_all()
         
         # Send DATA frame to sender
-        self.channel.send(raw, direction="receiver_to_sender")
+        self.channel.send_to_sender(raw)
         
         print(f"Receiver: sent data with piggybacking ACk={ack}")
         
@@ -129,7 +131,7 @@ class Receiver:
         
         # If there is data to send, piggyback the ACK
         if self.network_queue:
-            payload = self.network_queue.pop(0)
+            payload = self.network_queue.popleft()
             self.send_data(payload)
         else:
             # Otherwise, send a standalone ACK
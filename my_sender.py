@@ -35,10 +35,12 @@ class Sender:
         #Max seq
         self.MAX_SEQ = 8
 
-        # Buffer of sent but not yet acknowledged frames
-        # Key: absolute sequence number
-        # Value: Frame object
-        self.buffer = {}
+        # Buffer of sent but not yet acknowledged frames: a fixed ring
+        # of MAX_SEQ slots indexed by (absolute seq % MAX_SEQ), each
+        # holding serialized frame bytes ready for retransmission (or
+        # None when the slot is free). The window never exceeds
+        # MAX_SEQ - 1 frames, so slots cannot collide.
+        self.buffer = [None] * self.MAX_SEQ
         
         # Timer for the oldest unacknowledged frame
         self.timer_start = None
@@ -62,25 +64,29 @@ class Sender:
             print("Sender window full, cannot send now")
             return
         
-        # Create a DATA frame
-        frame = Frame(frame_type=0, seq=self.next_seq % 8, ack=0, payload=payload)
+        # Create a DATA frame (fields come from internal state, so the
+        # unchecked constructor is safe here)
+        frame = Frame._new(frame_type=0, seq=self.next_seq % 8, ack=0, payload=payload)
         
         # Serialize frame into raw bytes
         raw = frame.to_bytes_all()
         
         # Send frame through the channel
-        self.channel.send(raw, direction="sender_to_receiver")
+        self.channel.send_to_receiver(raw)
         
-        # Store frame in buffer for possible retransmission
-        self.buffer[self.next_seq] = frame
+        # Store the serialized bytes for possible retransmission; the
+        # frame is immutable on the wire, so retransmissions can resend
+        # the same bytes without re-serializing
+        self.buffer[self.next_seq % self.MAX_SEQ] = raw
         
         print(f"Sender: sent frame seq={self.next_seq}")
         
         # Advance next sequence number
         self.next_seq += 1
-        
-        # Start timer if this is the first unacknowledged frame
-        if self.base == self.next_seq:
+
+        # Start timer if it is not already running (i.e. this is the
+        # first unacknowledged frame)
+        if self.timer_start is None:
             self.timer_start = time.time()
 
     def receive_ack(self, raw: bytes):
@@ -91,46 +97,76 @@ class Sender:
         - standalone ACK frames
         - piggybacked DATA + ACK frames
         """
-        
-        # Attempt to decode and verify the received frame
+
+        # Fast path for the protocol's most frequent message: a
+        # standalone ACK is always exactly 3 bytes (header, length=0,
+        # checksum). Verify the checksum over the 2-byte prefix and read
+        # the ACK number straight from the header, with no Frame object
+        # or payload slice.
+        if len(raw) == 3 and raw[1] == 0 and raw[0] >> 6 == 1:
+            if Frame.calculate_checksum(raw[:2]) != raw[2]:
+                print("Sender: received corrupted ACK")
+                return
+            self._advance_window(raw[0] & 0b111)
+            return
+
+        # Full path: piggybacked DATA frames (and anything malformed)
+        # go through the regular decoder
         try:
             frame = Frame.from_bytes(raw)
         except ValueError:
             print("Sender: received corrupted ACK")
             return
-        
+
         # If the frame contains DATA (piggybacking case),
         # deliver it to the network layer
         if frame.frame_type == 0:
             print(f"Sender: received DATA from receiver -> {frame.payload}")
             self.deliver_to_network(frame.payload)
 
-        # Extract cumulative acknowledgment number
-        ack = frame.ack
-        
+        self._advance_window(frame.ack)
+
+    def _advance_window(self, ack):
+        """
+        Apply a cumulative acknowledgment: slide the window, free the
+        acknowledged buffer slots and manage the retransmission timer.
+        """
+
+        # Slide the window if the ACK is valid.
+        # The ACK names the last in-order frame the receiver accepted, so
+        # the number of newly acknowledged frames is the modular distance
+        # from the current base to that frame, inclusive. A distance of
+        # zero or one exceeding the frames in flight means the ACK is a
+        # duplicate or stale, and the window does not move.
+        delta = (ack - self.base + 1) % self.MAX_SEQ
+        if 0 < delta <= self.next_seq - self.base:
+            # Free exactly the acknowledged slots in the ring
+            for seq in range(self.base, self.base + delta):
+                self.buffer[seq % self.MAX_SEQ] = None
+            self.base += delta
+            print(f"Sender: ACK received, base updated to {self.base}")
 
-        # Slide the window if the ACK is valid
-        new_base = self.base
-        while new_base < self.next_seq:
-            if new_base % self.MAX_SEQ == ack:
-                self.base = new_base + 1
-                print(f"Sender: ACK received, base updated to {self.base}")
-                break
-            new_base += 1
-            
-        # Remove acknowledged frames from buffer
-        keys_to_remove = [k for k in self.buffer if k < self.base]
-        for k in keys_to_remove:
-            del self.buffer[k]
-        
         # Timer management
-        if not self.buffer:
+        if self.base == self.next_seq:
             # No outstanding frames -> stop timer
             self.timer_start = None
         else:
             # Outstanding frames remain -> restart timer
             self.timer_start = time.time()
     
+    def time_until_timeout(self):
+        """
+        Return the seconds remaining until the retransmission timer
+        expires, or None when no frame is outstanding.
+
+        Lets the simulation loop sleep exactly until the next deadline
+        instead of polling at a fixed interval.
+        """
+
+        if self.timer_start is None:
+            return None
+        return self.timer_start + self.timeout - time.time()
+
     def check_timeout(self):
         """
         Check if the retransmission timer has expired.
@@ -150,15 +186,16 @@ class Sender:
             # Restart timer
             self.timer_start = time.time()
 
-            # Retransmit all outstanding frames (go-back-n)
-            seq = self.base
-            while seq < self.next_seq:
-                frame = self.buffer.get(seq)
-                if frame is not None:
-                    raw = frame.to_bytes_all()
-                    self.channel.send(raw, direction="sender_to_receiver")
+            # Collect all outstanding frames (go-back-n), reusing the
+            # bytes serialized at first transmission, and hand them to
+            # the channel as one batch
+            raws = []
+            for seq in range(self.base, self.next_seq):
+                raw = self.buffer[seq % self.MAX_SEQ]
+                if raw is not None:
+                    raws.append(raw)
                     print(f"Sender: retransmitted frame seq={seq}")
-                seq += 1 
+            self.channel.send_many_to_receiver(raws)
 
     def deliver_to_network(self, payload: bytes):
         """